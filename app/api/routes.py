@@ -1,19 +1,36 @@
 """API routes for health checks and user management."""
-from fastapi import APIRouter, Request, HTTPException
+from typing import TYPE_CHECKING
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response
 from loguru import logger
 from app.models.schemas import HealthCheckResponse, UserCreate, UserResponse
 from app.core.config import settings
+from app.core.correlation_id import get_correlation_id
+from app.core.store import UserStore
+
+if TYPE_CHECKING:
+    from loguru import Logger
 
 router = APIRouter()
 
+# Module-level bound logger; request_logger binds the correlation ID onto it once per request
+log = logger.bind(component="routes")
+
 # In-memory database for demo purposes
-users_db: dict = {}
-next_user_id = 1
+users_db = UserStore()
 
+# The health payload never changes, so it is encoded once at import time
+_HEALTH_BODY = orjson.dumps(HealthCheckResponse(status="healthy", version=settings.version).model_dump())
 
-def get_correlation_id(request: Request) -> str:
-    """Extract correlation ID from request state."""
-    return getattr(request.state, "correlation_id", "N/A")
+
+async def request_logger(request: Request) -> "Logger":
+    """Return the logger bound to the current request's correlation ID, cached on request.state."""
+    req_log = getattr(request.state, "logger", None)
+    if req_log is None:
+        req_log = request.state.logger = log.bind(correlation_id=get_correlation_id() or "N/A")
+    return req_log
 
 
 @router.get(
@@ -22,24 +39,17 @@ def get_correlation_id(request: Request) -> str:
     tags=["Health"],
     summary="Health check endpoint",
 )
-async def health_check(request: Request) -> HealthCheckResponse:
+async def health_check() -> Response:
     """
     Health check endpoint to verify service status.
 
     Returns:
-        HealthCheckResponse: Service status and version
+        HealthCheckResponse: Service status and version, served from a pre-encoded body
     """
-    correlation_id = get_correlation_id(request)
-
-    logger.bind(correlation_id=correlation_id).info(
-        "Health check performed",
-        endpoint="/health",
-    )
+    # Probes hit this constantly; keep them out of INFO logs
+    log.debug("Health check performed")
 
-    return HealthCheckResponse(
-        status="healthy",
-        version=settings.version,
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.post(
@@ -48,56 +58,42 @@ async def health_check(request: Request) -> HealthCheckResponse:
     tags=["Users"],
     summary="Create a new user",
 )
-async def create_user(user: UserCreate, request: Request) -> UserResponse:
+async def create_user(user: UserCreate, req_log: "Logger" = Depends(request_logger)) -> UserResponse:
     """
     Create a new user with validated data.
 
     Args:
         user: User creation request
-        request: FastAPI request object
+        req_log: Logger bound to the request's correlation ID
 
     Returns:
         UserResponse: Created user details
     """
-    correlation_id = get_correlation_id(request)
-    global next_user_id
-
-    logger.bind(correlation_id=correlation_id).info(
+    req_log.info(
         "Creating new user",
         user_name=user.name,
         user_email=user.email,
         user_age=user.age,
     )
 
-    try:
-        # Create user
-        user_id = next_user_id
-        next_user_id += 1
-
-        new_user = UserResponse(
-            id=user_id,
-            name=user.name,
-            email=user.email,
-            age=user.age,
-        )
+    user_id = users_db.next_id()
 
-        users_db[user_id] = new_user
+    # Input was already validated as UserCreate, so skip re-validation
+    new_user = UserResponse.model_construct(
+        id=user_id,
+        name=user.name,
+        email=user.email,
+        age=user.age,
+    )
 
-        logger.bind(correlation_id=correlation_id).info(
-            "User created successfully",
-            user_id=user_id,
-            user_name=user.name,
-        )
+    users_db.put(new_user)
 
-        return new_user
+    req_log.info(
+        "User created successfully",
+        user_id=user_id,
+    )
 
-    except Exception as exc:
-        logger.bind(correlation_id=correlation_id).error(
-            "Error creating user",
-            error=str(exc),
-            exc_info=True,
-        )
-        raise HTTPException(status_code=500, detail="Failed to create user")
+    return new_user
 
 
 @router.get(
@@ -106,13 +102,13 @@ async def create_user(user: UserCreate, request: Request) -> UserResponse:
     tags=["Users"],
     summary="Get user by ID",
 )
-async def get_user(user_id: int, request: Request) -> UserResponse:
+async def get_user(user_id: int, req_log: "Logger" = Depends(request_logger)) -> UserResponse:
     """
     Retrieve user details by ID.
 
     Args:
         user_id: User ID to retrieve
-        request: FastAPI request object
+        req_log: Logger bound to the request's correlation ID
 
     Returns:
         UserResponse: User details
@@ -120,23 +116,20 @@ async def get_user(user_id: int, request: Request) -> UserResponse:
     Raises:
         HTTPException: If user not found
     """
-    correlation_id = get_correlation_id(request)
-
-    logger.bind(correlation_id=correlation_id).info(
+    req_log.info(
         "Fetching user details",
         user_id=user_id,
     )
 
-    if user_id not in users_db:
-        logger.bind(correlation_id=correlation_id).warning(
+    user = users_db.get(user_id)
+    if user is None:
+        req_log.warning(
             "User not found",
             user_id=user_id,
         )
         raise HTTPException(status_code=404, detail="User not found")
 
-    user = users_db[user_id]
-
-    logger.bind(correlation_id=correlation_id).info(
+    req_log.info(
         "User retrieved successfully",
         user_id=user_id,
         user_name=user.name,
@@ -151,24 +144,19 @@ async def get_user(user_id: int, request: Request) -> UserResponse:
     tags=["Users"],
     summary="List all users",
 )
-async def list_users(request: Request) -> list[UserResponse]:
+async def list_users(req_log: "Logger" = Depends(request_logger)) -> Response:
     """
     List all users in the system.
 
-    Args:
-        request: FastAPI request object
-
     Returns:
-        List of all users
+        List of all users, served from the store's cached JSON encoding
     """
-    correlation_id = get_correlation_id(request)
-
-    logger.bind(correlation_id=correlation_id).info(
+    req_log.info(
         "Fetching all users",
         total_users=len(users_db),
     )
 
-    return list(users_db.values())
+    return Response(content=users_db.values_json(), media_type="application/json")
 
 
 @router.put(
@@ -177,14 +165,14 @@ async def list_users(request: Request) -> list[UserResponse]:
     tags=["Users"],
     summary="Update user details",
 )
-async def update_user(user_id: int, user: UserCreate, request: Request) -> UserResponse:
+async def update_user(user_id: int, user: UserCreate, req_log: "Logger" = Depends(request_logger)) -> UserResponse:
     """
     Update existing user details.
 
     Args:
         user_id: User ID to update
         user: Updated user data
-        request: FastAPI request object
+        req_log: Logger bound to the request's correlation ID
 
     Returns:
         UserResponse: Updated user details
@@ -192,9 +180,7 @@ async def update_user(user_id: int, user: UserCreate, request: Request) -> UserR
     Raises:
         HTTPException: If user not found
     """
-    correlation_id = get_correlation_id(request)
-
-    logger.bind(correlation_id=correlation_id).info(
+    req_log.info(
         "Updating user",
         user_id=user_id,
         new_name=user.name,
@@ -202,37 +188,27 @@ async def update_user(user_id: int, user: UserCreate, request: Request) -> UserR
     )
 
     if user_id not in users_db:
-        logger.bind(correlation_id=correlation_id).warning(
+        req_log.warning(
             "Cannot update - user not found",
             user_id=user_id,
         )
         raise HTTPException(status_code=404, detail="User not found")
 
-    try:
-        updated_user = UserResponse(
-            id=user_id,
-            name=user.name,
-            email=user.email,
-            age=user.age,
-        )
-
-        users_db[user_id] = updated_user
+    updated_user = UserResponse.model_construct(
+        id=user_id,
+        name=user.name,
+        email=user.email,
+        age=user.age,
+    )
 
-        logger.bind(correlation_id=correlation_id).info(
-            "User updated successfully",
-            user_id=user_id,
-        )
+    users_db.put(updated_user)
 
-        return updated_user
+    req_log.info(
+        "User updated successfully",
+        user_id=user_id,
+    )
 
-    except Exception as exc:
-        logger.bind(correlation_id=correlation_id).error(
-            "Error updating user",
-            user_id=user_id,
-            error=str(exc),
-            exc_info=True,
-        )
-        raise HTTPException(status_code=500, detail="Failed to update user")
+    return updated_user
 
 
 @router.delete(
@@ -240,13 +216,13 @@ async def update_user(user_id: int, user: UserCreate, request: Request) -> UserR
     tags=["Users"],
     summary="Delete user",
 )
-async def delete_user(user_id: int, request: Request) -> dict:
+async def delete_user(user_id: int, req_log: "Logger" = Depends(request_logger)) -> dict:
     """
     Delete a user by ID.
 
     Args:
         user_id: User ID to delete
-        request: FastAPI request object
+        req_log: Logger bound to the request's correlation ID
 
     Returns:
         Success message
@@ -254,35 +230,23 @@ async def delete_user(user_id: int, request: Request) -> dict:
     Raises:
         HTTPException: If user not found
     """
-    correlation_id = get_correlation_id(request)
-
-    logger.bind(correlation_id=correlation_id).info(
+    req_log.info(
         "Deleting user",
         user_id=user_id,
     )
 
     if user_id not in users_db:
-        logger.bind(correlation_id=correlation_id).warning(
+        req_log.warning(
             "Cannot delete - user not found",
             user_id=user_id,
         )
         raise HTTPException(status_code=404, detail="User not found")
 
-    try:
-        del users_db[user_id]
-
-        logger.bind(correlation_id=correlation_id).info(
-            "User deleted successfully",
-            user_id=user_id,
-        )
+    users_db.delete(user_id)
 
-        return {"message": f"User {user_id} deleted successfully"}
+    req_log.info(
+        "User deleted successfully",
+        user_id=user_id,
+    )
 
-    except Exception as exc:
-        logger.bind(correlation_id=correlation_id).error(
-            "Error deleting user",
-            user_id=user_id,
-            error=str(exc),
-            exc_info=True,
-        )
-        raise HTTPException(status_code=500, detail="Failed to delete user")
+    return {"message": f"User {user_id} deleted successfully"}
@@ -1,14 +1,16 @@
 """Correlation ID context management for request tracing."""
 import contextvars
+import itertools
+import os
 from typing import Optional
 
 # Context variable to store correlation ID across async contexts
 _correlation_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("correlation_id", default=None)
 
 
-def set_correlation_id(correlation_id: str) -> None:
-    """Set correlation ID in context."""
-    _correlation_id_var.set(correlation_id)
+def set_correlation_id(correlation_id: str) -> contextvars.Token:
+    """Set correlation ID in context, returning a token for reset_correlation_id()."""
+    return _correlation_id_var.set(correlation_id)
 
 
 def get_correlation_id() -> Optional[str]:
@@ -16,6 +18,33 @@ def get_correlation_id() -> Optional[str]:
     return _correlation_id_var.get()
 
 
-def reset_correlation_id() -> None:
-    """Reset correlation ID in context."""
-    _correlation_id_var.set(None)
+def reset_correlation_id(token: Optional[contextvars.Token] = None) -> None:
+    """Reset correlation ID in context, restoring the value saved in ``token`` if given."""
+    if token is None:
+        _correlation_id_var.set(None)
+    else:
+        _correlation_id_var.reset(token)
+
+
+# Per-process random prefix plus a counter: unique IDs without a urandom call per request
+_id_prefix = ""
+_id_counter = itertools.count()
+
+
+def _reseed_id_generator() -> None:
+    """Draw a fresh random prefix; also run in forked children so workers never collide."""
+    global _id_prefix, _id_counter
+    raw = os.urandom(8).hex()
+    _id_prefix = f"{raw[:8]}-{raw[8:12]}-{raw[12:]}-"
+    _id_counter = itertools.count()
+
+
+_reseed_id_generator()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_id_generator)
+
+
+def generate_correlation_id() -> str:
+    """Generate a new UUID-formatted correlation ID."""
+    n = next(_id_counter)
+    return f"{_id_prefix}{n >> 48:04x}-{n & 0xFFFFFFFFFFFF:012x}"
@@ -1,47 +1,175 @@
 """Logging configuration using Loguru and structlog with correlation ID."""
+import atexit
+import os
+import queue
 import sys
-import json
+import threading
 from pathlib import Path
+from typing import Optional
+import orjson
 from loguru import logger
-from pydantic_settings import BaseSettings
 
+from app.core.config import settings
+from app.core.correlation_id import get_correlation_id
 
-class Settings(BaseSettings):
-    """Application settings."""
+# Console formats: colored for interactive terminals, plain for container/journal output
+CONSOLE_FORMAT = (
+    "<level>{level: <8}</level> | <green>{extra[correlation_id]}</green> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+PLAIN_CONSOLE_FORMAT = "{level: <8} | {extra[correlation_id]} | {name}:{function}:{line} - {message}"
 
-    app_name: str = "FastAPI Logging Demo"
-    debug: bool = False
-    log_level: str = "INFO"
-    log_dir: Path = Path("logs")
+# Maximum number of JSON lines coalesced into a single writev() call
+JSON_BATCH_SIZE = 256
 
-    model_config = {"env_file": ".env"}
 
+class BatchedJsonWriter:
+    """Append pre-serialized JSON lines to a file from a background thread.
 
-settings = Settings()
+    Producers only enqueue bytes; a single daemon thread drains the queue and
+    writes whole batches with one ``os.writev`` on a persistently open
+    ``O_APPEND`` descriptor. The file is reopened when it has been rotated
+    away underneath us.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: Path, batch_size: int = JSON_BATCH_SIZE):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._fd = self._open()
+        self._thread = threading.Thread(target=self._run, name="json-log-writer", daemon=True)
+        self._thread.start()
+
+    def _open(self) -> int:
+        return os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _reopen_if_rotated(self) -> None:
+        try:
+            rotated = os.stat(self.path).st_ino != os.fstat(self._fd).st_ino
+        except FileNotFoundError:
+            rotated = True
+        if rotated:
+            # Open before closing so a failed open keeps a valid descriptor instead of a stale number
+            new_fd = self._open()
+            os.close(self._fd)
+            self._fd = new_fd
+
+    def _write(self, batch: list) -> None:
+        self._reopen_if_rotated()
+        written = os.writev(self._fd, batch)
+        if written < sum(map(len, batch)):
+            # Short write (e.g. disk pressure): finish the rest with plain writes
+            remaining = memoryview(b"".join(batch))[written:]
+            while remaining:
+                remaining = remaining[os.write(self._fd, remaining) :]
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = []
+            while item is not self._STOP:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    self._write(batch)
+                except OSError:
+                    pass  # Never let log I/O errors kill the writer thread
+            if item is self._STOP:
+                return
+
+    def put(self, line: bytes) -> None:
+        """Enqueue one serialized JSON line (including the trailing newline)."""
+        self._queue.put_nowait(line)
+
+    def close(self) -> None:
+        """Flush pending lines, stop the writer thread and close the file."""
+        self._queue.put_nowait(self._STOP)
+        self._thread.join()
+        os.close(self._fd)
+
+
+_json_writer: Optional[BatchedJsonWriter] = None
+_configured = False
+
+
+def _close_json_writer() -> None:
+    global _json_writer
+    if _json_writer is not None:
+        _json_writer.close()
+        _json_writer = None
+
+
+atexit.register(_close_json_writer)
 
 
 def patcher(record):
-    """Add default correlation_id to record if not present."""
+    """Add correlation_id from the request context (or "N/A") to record if not present."""
     if "correlation_id" not in record["extra"]:
-        record["extra"]["correlation_id"] = "N/A"
+        record["extra"]["correlation_id"] = get_correlation_id() or "N/A"
+
+
+def serialize_record(record) -> bytes:
+    """Serialize a Loguru record into one newline-terminated JSON line."""
+    # Copy extra once and pop the promoted keys; several times cheaper than a filtering comprehension
+    extra_fields = dict(record["extra"])
+    correlation_id = extra_fields.pop("correlation_id", "N/A")
+    extra_fields.pop("request_id", None)
+
+    log_entry = {
+        "timestamp": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+        "correlation_id": correlation_id,
+    }
+
+    # Add extra fields if present
+    if extra_fields:
+        log_entry["extra"] = extra_fields
+
+    return orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE)
 
 
 def setup_logging() -> None:
-    """Configure Loguru with both console and file handlers."""
+    """Configure Loguru with both console and file handlers.
+
+    Safe to call more than once; only the first call registers sinks.
+    """
+    global _configured, _json_writer
+
+    if _configured:
+        return
+    _configured = True
+
     # Remove default handler
     logger.remove()
 
+    # Default correlation_id for records logged outside a request
+    logger.configure(patcher=patcher)
+
     # Ensure logs directory exists
     settings.log_dir.mkdir(exist_ok=True)
 
-    # Console handler with colored output and correlation ID
+    # Console handler with correlation ID; colors only when attached to a terminal
+    is_tty = sys.stdout.isatty()
     logger.add(
         sys.stdout,
-        format="<level>{level: <8}</level> | <green>{extra[correlation_id]}</green> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>",
+        format=CONSOLE_FORMAT if is_tty else PLAIN_CONSOLE_FORMAT,
         level=settings.log_level,
-        colorize=True,
-        filter=patcher,
+        colorize=is_tty,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
     # File handler with rotation - General logs
@@ -52,12 +180,12 @@ def setup_logging() -> None:
         rotation="100 MB",
         retention="10 days",
         compression="zip",
-        backtrace=True,
-        diagnose=True,
-        filter=patcher,
+        backtrace=False,
+        diagnose=False,
+        enqueue=True,
     )
 
-    # File handler for errors only
+    # File handler for errors only (the only sink with extended tracebacks)
     logger.add(
         settings.log_dir / "errors.log",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {extra[correlation_id]} | {name}:{function}:{line} - {message}",
@@ -67,7 +195,7 @@ def setup_logging() -> None:
         compression="zip",
         backtrace=True,
         diagnose=True,
-        filter=patcher,
+        enqueue=True,
     )
 
     # Structured JSON logs for processing with correlation ID
@@ -80,41 +208,25 @@ def setup_logging() -> None:
         retention="10 days",
         compression="zip",
         serialize=False,
+        backtrace=False,
+        diagnose=False,
+        enqueue=True,
     )
 
     # Add a separate custom JSON handler using json_formatter
+    _json_writer = BatchedJsonWriter(settings.log_dir / "structured.json")
+    writer = _json_writer
+
     def json_sink(message):
         """Sink for JSON formatted messages."""
-        record = message.record
         try:
-            correlation_id = record["extra"].get("correlation_id", "N/A")
-            # Filter extra dict to exclude correlation_id and request_id
-            extra_fields = {k: v for k, v in record["extra"].items() if k not in ("correlation_id", "request_id")}
-
-            log_entry = {
-                "timestamp": record["time"].isoformat(),
-                "level": record["level"].name,
-                "logger": record["name"],
-                "function": record["function"],
-                "line": record["line"],
-                "message": record["message"],
-                "correlation_id": correlation_id,
-            }
-
-            # Add extra fields if present
-            if extra_fields:
-                log_entry["extra"] = extra_fields
-
-            with open(settings.log_dir / "structured.json", "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
+            writer.put(serialize_record(message.record))
         except Exception:
             pass  # Silently ignore formatting errors
 
     logger.add(
         json_sink,
         level=settings.log_level,
+        backtrace=False,
+        diagnose=False,
     )
-
-
-# Initialize logging on module import
-setup_logging()
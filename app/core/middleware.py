@@ -1,12 +1,18 @@
 """FastAPI middleware for request/response logging with correlation ID."""
 import time
-import uuid
-from typing import Callable
+from typing import Callable, Iterable
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 from loguru import logger
-from app.core.correlation_id import set_correlation_id
+from app.core.correlation_id import generate_correlation_id, reset_correlation_id, set_correlation_id
+
+CORRELATION_ID_HEADER = "X-Correlation-ID"
+REQUEST_ID_HEADER = "X-Request-ID"
+
+_log = logger.bind(component="middleware")
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
@@ -15,28 +21,30 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and response with correlation ID logging."""
         # Extract correlation ID from request headers or generate new one
-        correlation_id_header = "X-Correlation-ID"
         request_correlation_id = (
-            request.headers.get(correlation_id_header) or request.headers.get("X-Request-ID") or str(uuid.uuid4())
+            request.headers.get(CORRELATION_ID_HEADER)
+            or request.headers.get(REQUEST_ID_HEADER)
+            or generate_correlation_id()
         )
 
         # Add correlation ID to request state for access in endpoints
         request.state.correlation_id = request_correlation_id
         request.state.request_id = request_correlation_id  # Backward compatibility
 
-        # Set correlation ID in context for the correlation_id module
-        set_correlation_id(request_correlation_id)
+        # Set correlation ID in context for the correlation_id module; the context is
+        # copied into the endpoint task (and threadpool for sync routes) by call_next
+        token = set_correlation_id(request_correlation_id)
+        try:
+            return await self._dispatch(request, call_next, request_correlation_id)
+        finally:
+            # Restore the previous value so it cannot leak into the caller's context
+            reset_correlation_id(token)
 
-        # Log request details with correlation ID
-        logger.bind(
+    async def _dispatch(self, request: Request, call_next: Callable, request_correlation_id: str) -> Response:
+        """Call the app and log the outcome for a request whose correlation ID is already set."""
+        req_log = _log.bind(
             correlation_id=request_correlation_id,
             request_id=request_correlation_id,
-        ).info(
-            "Incoming request",
-            method=request.method,
-            path=request.url.path,
-            query_params=dict(request.query_params),
-            client=request.client.host if request.client else None,
         )
 
         # Track request time
@@ -44,40 +52,52 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         try:
             response = await call_next(request)
-
-            # Calculate response time
-            process_time = time.time() - start_time
-
-            # Log response details with correlation ID
-            logger.bind(
-                correlation_id=request_correlation_id,
-                request_id=request_correlation_id,
-            ).info(
-                "Response sent",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                process_time_ms=f"{process_time * 1000:.2f}",
-            )
-
-            # Add correlation ID headers to response
-            response.headers[correlation_id_header] = request_correlation_id
-            response.headers["X-Request-ID"] = request_correlation_id
-
-            return response
-
         except Exception as exc:
             process_time = time.time() - start_time
 
             # Log error
-            logger.bind(
-                correlation_id=request_correlation_id,
-                request_id=request_correlation_id,
-            ).error(
+            req_log.error(
                 "Request processing error",
                 method=request.method,
                 path=request.url.path,
+                query_params=dict(request.query_params),
+                client=request.client.host if request.client else None,
                 error=str(exc),
-                process_time_ms=f"{process_time * 1000:.2f}",
+                process_time_ms=round(process_time * 1000, 2),
             )
             raise
+
+        # Calculate response time
+        process_time = time.time() - start_time
+
+        # Log request and response details in a single record
+        req_log.info(
+            "Response sent",
+            method=request.method,
+            path=request.url.path,
+            query=request.url.query,
+            client=request.client.host if request.client else None,
+            status_code=response.status_code,
+            process_time_ms=round(process_time * 1000, 2),
+        )
+
+        # Add correlation ID headers to response
+        response.headers[CORRELATION_ID_HEADER] = request_correlation_id
+        response.headers[REQUEST_ID_HEADER] = request_correlation_id
+
+        return response
+
+
+class PathExemptCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that passes the given paths (e.g. health probes) straight through."""
+
+    def __init__(self, app: ASGIApp, exempt_paths: Iterable[str] = (), **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Skip origin checks and header rewriting for exempt paths."""
+        if scope["type"] == "http" and scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
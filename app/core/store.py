@@ -0,0 +1,92 @@
+"""In-memory user store for demo purposes."""
+import itertools
+import threading
+from typing import List, Optional
+
+import orjson
+
+from app.models.schemas import UserResponse
+
+
+class UserStore:
+    """Thread-safe in-memory user store indexed by user ID.
+
+    IDs are issued sequentially and never reused, so users live in a list at
+    the index of their ID. Slot 0 is unused and deleted users leave a ``None``
+    tombstone, which keeps lookups to a bounds check and a list index.
+    """
+
+    def __init__(self):
+        self._users: List[Optional[UserResponse]] = [None]
+        self._live = 0
+        self._lock = threading.Lock()
+        # Serialized values() for read-mostly listing; dropped on every write
+        self._json_cache: Optional[bytes] = None
+        self._versions = itertools.count(1)
+        self._version = 0
+
+    def next_id(self) -> int:
+        """Reserve and return the next unused user ID."""
+        with self._lock:
+            self._users.append(None)
+            return len(self._users) - 1
+
+    def get(self, user_id: int) -> Optional[UserResponse]:
+        """Return the user with the given ID, or None if it does not exist."""
+        users = self._users
+        if 0 < user_id < len(users):
+            return users[user_id]
+        return None
+
+    def put(self, user: UserResponse) -> None:
+        """Insert or replace a user under an ID issued by next_id()."""
+        with self._lock:
+            if self._users[user.id] is None:
+                self._live += 1
+            self._users[user.id] = user
+            self._invalidate()
+
+    def delete(self, user_id: int) -> bool:
+        """Remove a user; return False if it did not exist."""
+        with self._lock:
+            if self.get(user_id) is None:
+                return False
+            self._users[user_id] = None
+            self._live -= 1
+            self._invalidate()
+        return True
+
+    def clear(self) -> None:
+        """Remove every user; IDs already issued are still never reused."""
+        with self._lock:
+            self._users = [None] * len(self._users)
+            self._live = 0
+            self._invalidate()
+
+    def values(self) -> List[UserResponse]:
+        """Return all users ordered by ID."""
+        return [user for user in self._users if user is not None]
+
+    def values_json(self) -> bytes:
+        """Return values() serialized as a JSON array, cached until the next write."""
+        cached = self._json_cache
+        if cached is None:
+            version = self._version
+            cached = orjson.dumps([user.model_dump() for user in self.values()])
+            # Only publish the result if no write happened while serializing; writers
+            # invalidate under the same lock, so the check and the store are atomic
+            with self._lock:
+                if version == self._version:
+                    self._json_cache = cached
+        return cached
+
+    def _invalidate(self) -> None:
+        """Drop the cached listing; call with self._lock held."""
+        self._version = next(self._versions)
+        self._json_cache = None
+
+    def __contains__(self, user_id: int) -> bool:
+        return self.get(user_id) is not None
+
+    def __len__(self) -> int:
+        return self._live
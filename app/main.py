@@ -1,12 +1,12 @@
 """Main FastAPI application with logging integration."""
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from app.core.config import settings
 from app.core.logging import setup_logging
-from app.core.middleware import LoggingMiddleware
+from app.core.middleware import LoggingMiddleware, PathExemptCORSMiddleware
 from app.api.routes import router
 
 # Initialize logging
@@ -39,11 +39,13 @@ app = FastAPI(
     version=settings.version,
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
+# Add CORS middleware; health probes are same-origin and skip it entirely
 app.add_middleware(
-    CORSMiddleware,
+    PathExemptCORSMiddleware,
+    exempt_paths={"/api/health"},
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
@@ -1,7 +1,62 @@
 """Configuration for pytest."""
 from pathlib import Path
+import asyncio
 import sys
 
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+
+def pytest_configure(config):
+    """Register the xdist_group marker so --strict-markers accepts it without pytest-xdist."""
+    config.addinivalue_line("markers", "xdist_group(name): run tests sharing the in-memory store on one worker")
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across the session so session-scoped async fixtures work."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """Import and build the app on first use, so runs that select no API tests skip it."""
+    from app.main import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
+    """Synchronous test client against the app, created once per test session."""
+    with TestClient(app_instance) as c:
+        # Pay FastAPI's first-request route and schema setup before the first test uses it
+        c.get("/api/health")
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(app_instance):
+    """Async HTTP client for tests that need concurrency or the caller's context."""
+    # No limits=/http2= here: httpx only applies them when it builds its own network
+    # transport, and ASGITransport calls the app in-process without a connection pool.
+    async with AsyncClient(transport=ASGITransport(app=app_instance), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def clean_store():
+    """Empty the in-memory user store around a test that depends on its exact contents."""
+    from app.api.routes import users_db
+
+    users_db.clear()
+    yield users_db
+    users_db.clear()
@@ -1,105 +1,165 @@
 """Tests for the FastAPI application."""
+import asyncio
+import itertools
+import orjson
 import pytest
 import uuid
-from httpx import AsyncClient
-from app.main import app
-
-
-@pytest.mark.asyncio
-async def test_root_endpoint():
-    """Test root endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/")
-        assert response.status_code == 200
-        assert "message" in response.json()
-
-
-@pytest.mark.asyncio
-async def test_health_check():
-    """Test health check endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/api/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert "version" in data
-
-
-@pytest.mark.asyncio
-async def test_create_user():
-    """Test user creation."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        user_data = {"name": "John Doe", "email": "john@example.com", "age": 30}
-        response = await client.post("/api/users", json=user_data)
-        assert response.status_code == 200
-        data = response.json()
-        assert data["name"] == "John Doe"
-        assert data["email"] == "john@example.com"
-        assert "id" in data
-
-
-@pytest.mark.asyncio
-async def test_get_user():
-    """Test get user by ID."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        # Create user first
-        user_data = {"name": "Jane Doe", "email": "jane@example.com", "age": 28}
-        create_response = await client.post("/api/users", json=user_data)
-        user_id = create_response.json()["id"]
-
-        # Get user
-        response = await client.get(f"/api/users/{user_id}")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == user_id
-        assert data["name"] == "Jane Doe"
-
-
-@pytest.mark.asyncio
-async def test_list_users():
-    """Test list all users."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/api/users")
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-
-@pytest.mark.asyncio
-async def test_correlation_id_header():
-    """Test that correlation ID is returned in response headers."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/api/health")
-        assert response.status_code == 200
-        assert "x-correlation-id" in response.headers or "x-request-id" in response.headers
-
-
-@pytest.mark.asyncio
-async def test_correlation_id_propagation():
-    """Test that custom correlation ID is propagated from request to response."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        test_correlation_id = str(uuid.uuid4())
-        headers = {"X-Correlation-ID": test_correlation_id}
-        response = await client.get("/api/health", headers=headers)
-        assert response.status_code == 200
-        # Verify correlation ID is in response headers
-        assert (
-            response.headers.get("x-correlation-id") == test_correlation_id
-            or response.headers.get("x-request-id") == test_correlation_id
-        )
-
-
-@pytest.mark.asyncio
-async def test_user_not_found():
-    """Test get non-existent user."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/api/users/99999")
-        assert response.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_validation_error():
-    """Test invalid user data."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        invalid_data = {"name": "", "email": "invalid"}  # Empty name
-        response = await client.post("/api/users", json=invalid_data)
-        assert response.status_code == 422  # Validation error
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core.correlation_id import get_correlation_id
+from app.core.middleware import LoggingMiddleware
+
+# Correlation IDs drawn once at import, so tests do not pay for uuid4() per use
+_CIDS = [uuid.uuid4().hex for _ in range(16)]
+_next_cid = itertools.cycle(_CIDS).__next__
+
+# Request bodies serialized once at import rather than on every json= call
+_JSON_HEADERS = {"content-type": "application/json"}
+_JOHN = {"name": "John Doe", "email": "john@example.com", "age": 30}
+_JOHN_BODY = orjson.dumps(_JOHN)
+_CACHE_USER = {"name": "Cache User", "email": "cache@example.com", "age": 40}
+_CACHE_USER_BODY = orjson.dumps(_CACHE_USER)
+_CACHE_USER_RENAMED_BODY = orjson.dumps({**_CACHE_USER, "name": "Renamed"})
+
+
+def _j(response):
+    """Parse a JSON response body with orjson, skipping httpx's charset detection."""
+    return orjson.loads(response.content)
+
+
+# Prebuilt GET /api/health requests, one per client, reused across tests
+_health_requests: dict = {}
+
+
+def _health(client):
+    """Return the cached health-check request for ``client``, building it on first use."""
+    request = _health_requests.get(client)
+    if request is None:
+        request = _health_requests[client] = client.build_request("GET", "/api/health")
+    return request
+
+
+@pytest.mark.xdist_group("users")
+async def test_readonly_endpoints(async_client, clean_store):
+    """Test the root, health and user listing endpoints in one concurrent burst."""
+    root, health, users = await asyncio.gather(
+        async_client.get("/"),
+        async_client.send(_health(async_client)),
+        async_client.get("/api/users"),
+    )
+
+    assert root.status_code == 200, "root endpoint failed"
+    assert "message" in _j(root), "root response has no message"
+
+    assert health.status_code == 200, "health check failed"
+    data = _j(health)
+    assert data["status"] == "healthy", "service not reporting healthy"
+    assert "version" in data, "health response has no version"
+
+    assert users.status_code == 200, "listing users failed"
+    # Only the shape matters here, so check the framing instead of decoding every user
+    assert users.headers.get("content-type", "").startswith("application/json"), "user listing is not JSON"
+    assert users.content[:1] == b"[" and users.content[-1:] == b"]", "user listing is not a list"
+
+
+@pytest.mark.xdist_group("users")
+def test_create_user(client):
+    """Test user creation and fetching the created user by ID."""
+    response = client.post("/api/users", content=_JOHN_BODY, headers=_JSON_HEADERS)
+    assert response.status_code == 200
+    data = _j(response)
+    assert data["name"] == "John Doe"
+    assert data["email"] == "john@example.com"
+    user_id = data["id"]
+
+    get_response = client.get(f"/api/users/{user_id}")
+    assert get_response.status_code == 200
+    fetched = _j(get_response)
+    assert fetched["id"] == user_id
+    assert fetched["name"] == "John Doe"
+
+
+@pytest.mark.xdist_group("users")
+def test_list_users_reflects_writes(client, clean_store):
+    """Test that the cached user listing is refreshed after each write."""
+    assert _j(client.get("/api/users")) == []
+    user_id = _j(client.post("/api/users", content=_CACHE_USER_BODY, headers=_JSON_HEADERS))["id"]
+    listed = {u["id"]: u for u in _j(client.get("/api/users"))}
+    assert list(listed) == [user_id]
+    assert listed[user_id]["name"] == "Cache User"
+
+    client.put(f"/api/users/{user_id}", content=_CACHE_USER_RENAMED_BODY, headers=_JSON_HEADERS)
+    listed = {u["id"]: u for u in _j(client.get("/api/users"))}
+    assert listed[user_id]["name"] == "Renamed"
+
+    client.delete(f"/api/users/{user_id}")
+    assert _j(client.get("/api/users")) == []
+
+
+def test_correlation_id_propagation(client):
+    """Test that the correlation ID header is returned and carries the caller's value."""
+    test_correlation_id = _next_cid()
+    headers = {"X-Correlation-ID": test_correlation_id}
+    response = client.get("/api/health", headers=headers)
+    assert response.status_code == 200
+    # Verify correlation ID is echoed, scanning raw header pairs instead of the case-folding lookup
+    assert any(
+        key.lower() in (b"x-correlation-id", b"x-request-id") and value.decode() == test_correlation_id
+        for key, value in response.headers.raw
+    )
+
+
+def test_generated_correlation_ids_are_unique(client):
+    """Test that requests without a correlation ID each get a new UUID-formatted one."""
+    first = client.send(_health(client)).headers["x-correlation-id"]
+    second = client.send(_health(client)).headers["x-correlation-id"]
+    assert first != second
+    assert str(uuid.UUID(first)) == first
+
+
+def test_cors_skips_health_probe(client):
+    """Test that CORS headers are applied to API routes but not to the health probe."""
+    headers = {"Origin": "http://example.com"}
+    users_response = client.get("/api/users", headers=headers)
+    health_response = client.get("/api/health", headers=headers)
+    assert "access-control-allow-origin" in users_response.headers
+    assert "access-control-allow-origin" not in health_response.headers
+
+
+async def test_correlation_id_reset_after_request(async_client):
+    """Test that the correlation ID context does not leak past the request."""
+    await async_client.get("/api/health", headers={"X-Correlation-ID": "leak-check"})
+    assert get_correlation_id() is None
+
+
+def test_correlation_id_visible_in_sync_route():
+    """Test that sync routes run in the threadpool still see the request's correlation ID."""
+    sync_app = FastAPI()
+    sync_app.add_middleware(LoggingMiddleware)
+
+    @sync_app.get("/cid")
+    def read_cid():
+        return {"correlation_id": get_correlation_id()}
+
+    with TestClient(sync_app) as client:
+        first = client.get("/cid", headers={"X-Correlation-ID": "sync-1"})
+        second = client.get("/cid", headers={"X-Correlation-ID": "sync-2"})
+        assert _j(first)["correlation_id"] == "sync-1"
+        assert _j(second)["correlation_id"] == "sync-2"
+
+
+@pytest.mark.parametrize(
+    "method,path,body,status",
+    [
+        ("GET", "/api/users/99999", None, 404),  # Unknown user
+        ("POST", "/api/users", {"name": "", "email": "invalid"}, 422),  # Empty name
+        ("POST", "/api/users", {"email": "a@b.co"}, 422),  # Missing name
+        ("POST", "/api/users", {"name": "x"}, 422),  # Missing email
+        ("POST", "/api/users", {"name": "x", "email": "a@b.co", "age": -1}, 422),  # Age below range
+        ("POST", "/api/users", {"name": "x" * 101, "email": "a@b.co"}, 422),  # Name too long
+    ],
+)
+def test_error_paths(client, method, path, body, status):
+    """Test that unknown users and invalid user data are rejected."""
+    response = client.request(method, path, json=body)
+    assert response.status_code == status
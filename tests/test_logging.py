@@ -0,0 +1,79 @@
+"""Tests for the logging configuration."""
+import errno
+import json
+import os
+
+import pytest
+
+from loguru import logger
+
+from app.core.logging import BatchedJsonWriter, serialize_record
+
+
+def test_serialize_record():
+    """Test that a record becomes one JSON line with extras split out."""
+    records = []
+    handler_id = logger.add(lambda message: records.append(message.record), level="DEBUG")
+    try:
+        logger.bind(correlation_id="cid-1", request_id="cid-1").info("Hello", user_id=7)
+    finally:
+        logger.remove(handler_id)
+
+    line = serialize_record(records[0])
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    entry = json.loads(line)
+    assert entry["message"] == "Hello"
+    assert entry["level"] == "INFO"
+    assert entry["correlation_id"] == "cid-1"
+    assert entry["extra"] == {"user_id": 7}
+    assert entry["timestamp"] == records[0]["time"].isoformat()
+
+
+def test_batched_json_writer_flushes_on_close(tmp_path):
+    """Test that every queued line is written once the writer is closed."""
+    path = tmp_path / "structured.json"
+    writer = BatchedJsonWriter(path, batch_size=4)
+    for i in range(10):
+        writer.put(json.dumps({"n": i}).encode() + b"\n")
+    writer.close()
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["n"] for line in lines] == list(range(10))
+
+
+def test_batched_json_writer_reopens_rotated_file(tmp_path):
+    """Test that the writer follows the path after the file is rotated away."""
+    path = tmp_path / "structured.json"
+    writer = BatchedJsonWriter(path)
+    path.rename(tmp_path / "structured.1.json")
+    writer.put(b'{"n": 1}\n')
+    writer.close()
+
+    assert path.read_text() == '{"n": 1}\n'
+    assert (tmp_path / "structured.1.json").read_text() == ""
+
+
+def test_batched_json_writer_survives_failed_reopen(tmp_path, monkeypatch):
+    """Test that a failed reopen after rotation never leaves the writer holding a closed fd."""
+    path = tmp_path / "structured.json"
+    writer = BatchedJsonWriter(path)
+    old_fd = writer._fd
+    path.rename(tmp_path / "structured.1.json")
+
+    def fail_open():
+        raise OSError(errno.EMFILE, "Too many open files")
+
+    monkeypatch.setattr(writer, "_open", fail_open)
+    with pytest.raises(OSError):
+        writer._reopen_if_rotated()
+    monkeypatch.undo()
+    assert writer._fd == old_fd
+    os.fstat(old_fd)  # Still open, so its number cannot be handed to another file
+
+    with open(tmp_path / "other.txt", "wb") as other:
+        writer.put(b'{"n": 1}\n')
+        writer.close()
+        other.write(b"other")
+
+    assert path.read_text() == '{"n": 1}\n'
+    assert (tmp_path / "other.txt").read_bytes() == b"other"